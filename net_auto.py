@@ -15,16 +15,79 @@ Still supports PRO v2:
 - outputs/, logs/, reports/
 """
 
+import io
+import itertools
 import json
 import os
 import csv
 import socket
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
+import re
+import selectors
+import subprocess
+import sys
+import threading
+import time
+import types
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from netmiko import ConnectHandler
-from colorama import Fore, Style, init
+from netmiko.cisco.cisco_ios import CiscoIosSSH
+from netmiko.cisco.cisco_xe import CiscoXeSSH
+from colorama import init
+
+# Bind driver classes once for the platforms we actually run, skipping
+# ConnectHandler's CLASS_MAPPER lookup per connection; anything else in
+# the inventory still goes through ConnectHandler.
+_HANDLER = {
+    "cisco_ios": CiscoIosSSH,
+    "cisco_xe": CiscoXeSSH,
+}
+
+try:
+    import orjson  # ~2-3x faster than stdlib json; optional
+except ImportError:
+    orjson = None
+
+# Plain ANSI escape table. Terminals that speak ANSI natively (any
+# POSIX tty, modern Windows Terminal) skip colorama's per-write
+# wrapping entirely; only legacy Windows consoles get the shim.
+C = types.SimpleNamespace(
+    R="\x1b[31m",       # red
+    G="\x1b[32m",       # green
+    Y="\x1b[33m",       # yellow
+    M="\x1b[35m",       # magenta
+    C="\x1b[36m",       # cyan
+    BRIGHT="\x1b[1m",
+    Z="\x1b[0m",        # reset
+)
+
+def _ansi_native():
+    return sys.stdout.isatty() and (os.name != "nt" or bool(os.environ.get("WT_SESSION")))
+
+if not _ansi_native():
+    init(autoreset=True)
+
+MAX_WORKERS = 32
 
-init(autoreset=True)
+# Console prints come from worker threads, so serialize them
+_PRINT_LOCK = threading.Lock()
+
+def cprint(msg):
+    """Thread-safe colored print (workers share one terminal)."""
+    with _PRINT_LOCK:
+        print(msg + C.Z)
+
+# Preformatted per-device status lines (hot path under fan-out)
+MSG_UNREACHABLE = C.R + "\n🚫 {name} ({host}) unreachable on SSH/22. Skipping."
+MSG_CONNECTING = C.M + "\n🔌 Connecting to {name} ({host})..."
+MSG_DONE = C.G + "✅ Done with {name}"
+MSG_ERROR = C.R + "❌ Error on {name}: {err}"
 
 # ---------------------------
 # Folders + Logging
@@ -34,23 +97,94 @@ LOG_DIR = "logs"
 REPORT_DIR = "reports"
 BACKUP_DIR = "backups"
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-os.makedirs(LOG_DIR, exist_ok=True)
-os.makedirs(REPORT_DIR, exist_ok=True)
-os.makedirs(BACKUP_DIR, exist_ok=True)
+_DIRS_READY = False
 
-logging.basicConfig(
-    filename=os.path.join(LOG_DIR, "automation.log"),
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s"
+def _ensure_dirs():
+    """Create the working directories once per process, not per import."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for d in (OUTPUT_DIR, LOG_DIR, REPORT_DIR, BACKUP_DIR):
+        os.makedirs(d, exist_ok=True)
+    _DIRS_READY = True
+
+# Worker threads only enqueue LogRecords; a QueueListener thread formats
+# them and a MemoryHandler batches the disk writes, so logging never
+# serializes the SSH workers on the file lock or a write syscall.
+# delay=True so the log file opens on first flush, after _ensure_dirs()
+_log_file = logging.FileHandler(os.path.join(LOG_DIR, "automation.log"), delay=True)
+_log_file.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+_log_batcher = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=_log_file
 )
+_log_queue = queue.Queue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_batcher)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+
+# ---------------------------
+# Background writer thread
+# ---------------------------
+# Workers are busy talking SSH; they shouldn't also block on disk.
+# save_output/backup push (path, bytes) here and one thread drains it,
+# so wall time tracks max(network, disk) instead of their sum.
+_WRITE_Q = queue.Queue()
+
+def _writer_loop():
+    while True:
+        item = _WRITE_Q.get()
+        try:
+            if item is None:
+                return
+            path, data, mode = item
+            with open(path, mode, buffering=1 << 20) as f:
+                f.write(data)
+        except Exception as e:
+            logging.error(f"Writer thread failed on {item}: {e}")
+        finally:
+            _WRITE_Q.task_done()
+
+_writer_thread = threading.Thread(target=_writer_loop, daemon=True)
+_writer_thread.start()
+
+def queue_write(path, data, mode="wb"):
+    """Hand bytes to the writer thread; returns immediately."""
+    _WRITE_Q.put((path, data, mode))
+
+def flush_writes():
+    """Block until every queued write has hit disk."""
+    _WRITE_Q.join()
+
+atexit.register(flush_writes)
+
+# ---------------------------
+# Session timestamp
+# ---------------------------
+# strftime+localtime per file adds up under threaded fan-out; stamp the
+# session once and disambiguate individual files with a cheap counter.
+# Shared prefix also makes one session's files trivially groupable.
+_FILE_SEQ = itertools.count(1)
+
+def session_timestamp():
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
 # ---------------------------
 # Load devices
 # ---------------------------
+# Inventory and command files rarely change between invocations, so the
+# parsed results are memoized keyed on (path, mtime); an edited file has
+# a new mtime and simply misses the cache.
+@functools.lru_cache(maxsize=8)
+def _load_devices_cached(path, mtime):
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
 def load_devices(path="devices.json"):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Shallow copy so callers can sort/filter without poisoning the cache
+    return list(_load_devices_cached(path, os.path.getmtime(path)))
 
 # ---------------------------
 # Reachability check (TCP 22)
@@ -63,14 +197,182 @@ def is_reachable(host, port=22, timeout=3):
     except OSError:
         return False
 
+def probe_all(hosts, port=22, timeout=3):
+    """Probe every host's TCP port at once; returns {host: bool}.
+
+    Non-blocking connect_ex + one selector means the whole sweep costs
+    one timeout instead of timeout-per-dead-host.
+    """
+    results = {host: False for host in hosts}
+    sel = selectors.DefaultSelector()
+
+    for host in results:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            err = sock.connect_ex((host, port))
+        except OSError:
+            sock.close()
+            continue
+        if err == 0:
+            results[host] = True
+            sock.close()
+            continue
+        sel.register(sock, selectors.EVENT_WRITE, host)
+
+    deadline = time.monotonic() + timeout
+    while sel.get_map():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for key, _ in sel.select(remaining):
+            sock, host = key.fileobj, key.data
+            results[host] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+            sel.unregister(sock)
+            sock.close()
+
+    for key in list(sel.get_map().values()):
+        sel.unregister(key.fileobj)
+        key.fileobj.close()
+    sel.close()
+
+    return results
+
+def ping_sweep(hosts, timeout=1):
+    """ICMP-sweep hosts with fping; returns the set of responders.
+
+    Entirely offline devices fail ICMP in ~1s instead of eating the
+    full TCP SYN timeout each. Returns None when fping isn't installed
+    so callers can fall straight through to the TCP probe.
+    """
+    if not hosts:
+        return set()
+    try:
+        proc = subprocess.run(
+            ["fping", "-a", "-q", "-t", str(int(timeout * 1000))] + list(hosts),
+            capture_output=True,
+            text=True,
+            timeout=timeout * 4 + 5
+        )
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+        return None
+    return {line.strip() for line in proc.stdout.splitlines() if line.strip()}
+
+# ---------------------------
+# Connect-RTT cache (LPT scheduling)
+# ---------------------------
+# With a bounded pool, wall time is dominated by whichever slow device
+# starts last. Remembering each host's last SSH connect duration lets
+# main() start the slowest devices first (longest-processing-time-first).
+RTT_CACHE_PATH = os.path.join(REPORT_DIR, "device_rtt.json")
+
+_RTT_LOCK = threading.Lock()
+_RTT_SEEN = {}
+
+def _load_rtt_cache():
+    try:
+        with open(RTT_CACHE_PATH, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+
+def _record_rtt(host, duration):
+    with _RTT_LOCK:
+        _RTT_SEEN[host] = duration
+
+def _save_rtt_cache():
+    with _RTT_LOCK:
+        if not _RTT_SEEN:
+            return
+        cache = _load_rtt_cache()
+        cache.update(_RTT_SEEN)
+    queue_write(RTT_CACHE_PATH, json.dumps(cache).encode("utf-8"))
+
+# ---------------------------
+# Connection pool
+# ---------------------------
+# Repeated operations against the same device (e.g. SHOW audit followed
+# by a CONFIG push) would otherwise pay the full TCP/SSH/auth handshake
+# each time — and some platforms rate-limit new sessions on top of that.
+POOL_MAX_AGE = 600        # seconds before a pooled conn is retired
+POOL_IDLE_TIMEOUT = 300   # idle conns older than this get swept
+
+_POOL = defaultdict(deque)
+_POOL_LOCK = threading.Lock()
+
+def _pool_key(device):
+    return (device["host"], 22, device["username"], device["device_type"])
+
+def _checkout_from_pool(key):
+    """Pop a live pooled connection for key, or None if there isn't one."""
+    with _POOL_LOCK:
+        idle = _POOL[key]
+        while idle:
+            conn = idle.pop()
+            try:
+                if conn.is_alive():
+                    # Restore the memoized prompt so the first send after
+                    # checkout doesn't re-run detection round-trips
+                    cached_prompt = getattr(conn, "_base_prompt_cached", None)
+                    if cached_prompt:
+                        conn.base_prompt = cached_prompt
+                    return conn
+                conn.disconnect()
+            except Exception:
+                pass
+    return None
+
+def return_to_pool(conn):
+    """Give a connection back for reuse instead of disconnecting it."""
+    try:
+        alive = conn.is_alive()
+    except Exception:
+        alive = False
+
+    if alive and time.monotonic() - conn._opened_at < POOL_MAX_AGE:
+        conn._idle_since = time.monotonic()
+        with _POOL_LOCK:
+            _POOL[conn._pool_key].append(conn)
+    else:
+        try:
+            conn.disconnect()
+        except Exception:
+            pass
+
+def _sweep_idle_conns():
+    """Periodically drop pooled connections that sat idle too long."""
+    now = time.monotonic()
+    with _POOL_LOCK:
+        for idle in _POOL.values():
+            stale = [c for c in idle if now - c._idle_since > POOL_IDLE_TIMEOUT]
+            for conn in stale:
+                idle.remove(conn)
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
+    timer = threading.Timer(POOL_IDLE_TIMEOUT, _sweep_idle_conns)
+    timer.daemon = True
+    timer.start()
+
+_sweep_idle_conns()
+
 # ---------------------------
 # Connect to device
 # ---------------------------
 def connect_device(device):
+    key = _pool_key(device)
+
+    conn = _checkout_from_pool(key)
+    if conn is not None:
+        logging.info(f"Reusing pooled connection to {device['name']} ({device['host']})")
+        return conn
+
     logging.info(f"Connecting to {device['name']} ({device['host']})")
+    started = time.monotonic()
 
-    conn = ConnectHandler(
-        device_type=device["device_type"],
+    kwargs = dict(
         host=device["host"],
         username=device["username"],
         password=device["password"],
@@ -80,26 +382,48 @@ def connect_device(device):
         auth_timeout=8
     )
 
+    handler = _HANDLER.get(device["device_type"])
+    if handler is not None:
+        conn = handler(**kwargs)
+    else:
+        conn = ConnectHandler(device_type=device["device_type"], **kwargs)
+
     if device.get("secret"):
         conn.enable()
 
+    _record_rtt(device["host"], time.monotonic() - started)
+
+    # Prompt detection costs CLI round-trips; memoize it once per conn
+    if not getattr(conn, "base_prompt", None):
+        conn.set_base_prompt()
+    conn._base_prompt_cached = conn.base_prompt
+
+    conn._pool_key = key
+    conn._opened_at = time.monotonic()
+    # Per-connection command cache: repeated slow reads (notably
+    # "show running-config") are served from memory until a config push
+    # invalidates them.
+    conn._cmd_cache = {}
+
     return conn
 
 # ---------------------------
 # Command helpers
 # ---------------------------
+@functools.lru_cache(maxsize=8)
+def _load_commands_cached(filename, mtime):
+    # One read, one decode — skips the universal-newline machinery of
+    # line-by-line text-mode iteration
+    with open(filename, "rb") as f:
+        data = f.read().decode("utf-8")
+    return tuple(cmd for cmd in (line.strip() for line in data.splitlines()) if cmd)
+
 def load_commands_from_file(filename):
-    commands = []
-    with open(filename, "r", encoding="utf-8") as f:
-        for line in f:
-            cmd = line.strip()
-            if cmd:
-                commands.append(cmd)
-    return commands
+    return list(_load_commands_cached(filename, os.path.getmtime(filename)))
 
 def get_commands_interactively(mode_name):
-    print(Fore.CYAN + f"\nEnter {mode_name} commands one by one.")
-    print(Fore.CYAN + "Type 'done' when finished.\n")
+    print(C.C + f"\nEnter {mode_name} commands one by one." + C.Z)
+    print(C.C + "Type 'done' when finished.\n" + C.Z)
 
     commands = []
     while True:
@@ -113,12 +437,40 @@ def get_commands_interactively(mode_name):
 # ---------------------------
 # SHOW mode (with per-command timeout)
 # ---------------------------
-def run_show_commands(conn, show_commands, cmd_timeout=10):
+def _split_on_prompt(raw, base_prompt, commands):
+    """Split batched output into per-command segments, or None on mismatch."""
+    # The >/# terminator is mandatory: a real exec prompt always carries
+    # it (base_prompt strips exactly that character), while ordinary
+    # output lines can start with the bare hostname ("R1 uptime is...")
+    # and must not split the transcript. Nothing greedier may follow, or
+    # the pattern would swallow the first word of the echoed command.
+    parts = re.split(rf"(?m)^{re.escape(base_prompt)}[>#][ \t]*", raw)
+    parts = [p.strip("\r\n") for p in parts if p.strip()]
+    if len(parts) != len(commands):
+        return None
+    # Strip the echoed command line so pipelined segments come out in
+    # the same format as the serial path's send_command output
+    segments = []
+    for cmd, part in zip(commands, parts):
+        first, _, rest = part.partition("\n")
+        if first.strip() == cmd:
+            part = rest.strip("\r\n")
+        segments.append(part)
+    return segments
+
+def _run_show_commands_serial(conn, show_commands, cmd_timeout):
+    """Original one-round-trip-per-command path (pipeline fallback)."""
+    cache = getattr(conn, "_cmd_cache", {})
     output = []
     for cmd in show_commands:
+        if cmd in cache:
+            logging.info(f"Serving SHOW from cache: {cmd}")
+            output.append(f"\n===== {cmd} =====\n{cache[cmd]}")
+            continue
         try:
             logging.info(f"Running SHOW: {cmd}")
             result = conn.send_command(cmd, read_timeout=cmd_timeout)
+            cache[cmd] = result
             output.append(f"\n===== {cmd} =====\n{result}")
         except Exception as e:
             msg = f"[SHOW TIMEOUT/ERROR] {cmd} -> {e}"
@@ -126,41 +478,154 @@ def run_show_commands(conn, show_commands, cmd_timeout=10):
             output.append(f"\n===== {cmd} =====\n{msg}")
     return "\n".join(output)
 
+def run_show_commands(conn, show_commands, cmd_timeout=10, pipeline=True):
+    """Run SHOW commands, batched down one channel where the platform allows.
+
+    Sending all commands at once pays the prompt-detection wait once
+    instead of once per command. Devices that close the channel on
+    batched input can set "no_pipeline" in the inventory to use the
+    per-command path.
+    """
+    if not show_commands:
+        return ""
+
+    if not pipeline:
+        return _run_show_commands_serial(conn, show_commands, cmd_timeout)
+
+    cache = getattr(conn, "_cmd_cache", {})
+    to_run = [cmd for cmd in show_commands if cmd not in cache]
+
+    fresh = {}
+    if to_run:
+        try:
+            batch = "\n".join(to_run) + "\n"
+            raw = conn.send_command_timing(
+                batch,
+                strip_prompt=False,
+                strip_command=False,
+                read_timeout=cmd_timeout * len(to_run)
+            )
+            segments = _split_on_prompt(raw, conn.base_prompt, to_run)
+        except Exception as e:
+            logging.warning(f"[PIPELINE ERROR] {e} — falling back to per-command")
+            return _run_show_commands_serial(conn, show_commands, cmd_timeout)
+
+        if segments is None:
+            # Prompt detection missed somewhere — keep the raw transcript
+            # whole under the first header rather than mislabel (and cache)
+            # bad segments.
+            logging.warning(
+                f"[PIPELINE SPLIT MISMATCH] prompt split failed for "
+                f"{len(to_run)} command(s); keeping raw transcript under '{to_run[0]}'"
+            )
+            fresh = {cmd: "" for cmd in to_run}
+            fresh[to_run[0]] = raw
+        else:
+            fresh = dict(zip(to_run, segments))
+            cache.update(fresh)
+
+    output = []
+    for cmd in show_commands:
+        segment = fresh[cmd] if cmd in fresh else cache.get(cmd, "")
+        logging.info(f"Ran SHOW (pipelined): {cmd}")
+        output.append(f"\n===== {cmd} =====\n{segment}")
+    return "\n".join(output)
+
 # ---------------------------
 # Backup running-config
 # ---------------------------
-def backup_running_config(conn, device_name):
+def backup_running_config(conn, device_name, ts=None):
     """Save running-config to backups/ before pushing changes."""
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"{device_name}_running-config_{timestamp}.cfg"
+    timestamp = ts or session_timestamp()
+    filename = f"{device_name}_running-config_{timestamp}_{next(_FILE_SEQ)}.cfg"
     filepath = os.path.join(BACKUP_DIR, filename)
 
     logging.info("Backing up running-config")
-    run_cfg = conn.send_command("show running-config", read_timeout=15)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(run_cfg)
+    cache = getattr(conn, "_cmd_cache", {})
+    if "show running-config" in cache:
+        queue_write(filepath, cache["show running-config"].encode("utf-8"))
+    else:
+        # Not cached: stream straight to disk chunk-by-chunk so peak
+        # memory stays bounded however large the running-config is
+        _stream_command_to_file(conn, "show running-config", filepath, read_timeout=15)
 
     logging.info(f"Backup saved to {filepath}")
     return filepath
 
+def _stream_command_to_file(conn, cmd, filepath, read_timeout=15):
+    """Run cmd on the raw channel and stream its output to filepath.
+
+    Chunks go through the writer queue as they arrive instead of being
+    accumulated into one giant string first. Output is written up to
+    (not including) the device prompt.
+    """
+    prompt = conn.base_prompt
+    # Anchored to its own line: the bare hostname also appears inside the
+    # output itself (e.g. the "hostname R1" line of a running-config), so
+    # a substring test would cut the stream short.
+    prompt_re = re.compile(rf"(?m)^{re.escape(prompt)}[>#]\s*$")
+    conn.write_channel(cmd + "\n")
+
+    tail = ""
+    mode = "wb"  # first chunk truncates, the rest append
+    echo_pending = True
+    deadline = time.monotonic() + read_timeout
+    while time.monotonic() < deadline:
+        chunk = conn.read_channel()
+        if not chunk:
+            time.sleep(0.05)
+            continue
+        buf = tail + chunk
+        if echo_pending:
+            # Drop the device's echo of the command itself, like
+            # send_command does, so the backup is a clean config
+            nl = buf.find("\n")
+            if nl < 0:
+                match = prompt_re.search(buf)
+                if match:
+                    queue_write(filepath, buf[:match.start()].encode("utf-8"), mode=mode)
+                    return
+                tail = buf  # hold everything until the first line is complete
+                continue
+            if buf[:nl].strip() == cmd:
+                buf = buf[nl + 1:]
+            echo_pending = False
+        match = prompt_re.search(buf)
+        if match:
+            queue_write(filepath, buf[:match.start()].encode("utf-8"), mode=mode)
+            return
+        # Hold back enough that a prompt split across reads is still seen
+        keep = len(prompt) + 16
+        flush, tail = buf[:-keep], buf[-keep:]
+        if flush:
+            queue_write(filepath, flush.encode("utf-8"), mode=mode)
+            mode = "ab"
+
+    # Leave the partial file on disk for forensics, but fail loudly: a
+    # truncated backup must not pass for a good one and let the config
+    # push proceed.
+    queue_write(filepath, tail.encode("utf-8"), mode=mode)
+    raise TimeoutError(f"[STREAM TIMEOUT] {cmd} — prompt not seen within {read_timeout}s")
+
 # ---------------------------
 # CONFIG mode (with per-command timeout)
 # ---------------------------
 def run_config_commands(conn, config_commands, cmd_timeout=10):
     logging.info("Entering CONFIG mode")
-    return conn.send_config_set(config_commands, read_timeout=cmd_timeout)
+    result = conn.send_config_set(config_commands, read_timeout=cmd_timeout)
+    # The config just changed; cached SHOW output is now stale
+    getattr(conn, "_cmd_cache", {}).clear()
+    return result
 
 # ---------------------------
 # Save output
 # ---------------------------
-def save_output(device_name, text, mode):
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"{mode}_{device_name}_{timestamp}.txt"
+def save_output(device_name, text, mode, ts=None):
+    timestamp = ts or session_timestamp()
+    filename = f"{mode}_{device_name}_{timestamp}_{next(_FILE_SEQ)}.txt"
     filepath = os.path.join(OUTPUT_DIR, filename)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(text)
+    queue_write(filepath, text.encode("utf-8"))
 
     logging.info(f"Output saved to {filepath}")
     return filepath
@@ -168,27 +633,31 @@ def save_output(device_name, text, mode):
 # ---------------------------
 # CSV session report
 # ---------------------------
-def save_session_report(rows):
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+def save_session_report(rows, ts=None):
+    timestamp = ts or session_timestamp()
     report_path = os.path.join(REPORT_DIR, f"session_summary_{timestamp}.csv")
 
     headers = [
         "device_name", "host", "reachable", "mode",
         "status", "commands_count", "backup_file", "output_file"
     ]
-    with open(report_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Headers are fixed and values are scalars: build plain lists and let
+    # csv.writer quote them in one C-level writerows pass, then hand the
+    # whole report to the writer thread as a single byte blob.
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerows(
+        [headers] + [[row[h] for h in headers] for row in rows]
+    )
+    queue_write(report_path, buf.getvalue().encode("utf-8"))
 
-    print(Fore.GREEN + f"\n📊 Session report saved → {report_path}")
+    print(C.G + f"\n📊 Session report saved → {report_path}" + C.Z)
     logging.info(f"Session report saved to {report_path}")
 
 # ---------------------------
 # Menus
 # ---------------------------
 def main_menu():
-    print(Style.BRIGHT + "\n=== Python Network Automation Tool (PRO v3) ===")
+    print(C.BRIGHT + "\n=== Python Network Automation Tool (PRO v3) ===" + C.Z)
     print("1) Run SHOW commands (safe / read-only)")
     print("2) Push CONFIG commands (makes changes)")
     return input("Choose option (1 or 2): ").strip()
@@ -200,18 +669,87 @@ def command_source_menu():
     return input("Choose option (1 or 2): ").strip()
 
 def ask_dry_run():
-    ans = input(Fore.YELLOW + "\nDry-run? (y/n): ").strip().lower()
+    ans = input(C.Y + "\nDry-run? (y/n): " + C.Z).strip().lower()
     return ans == "y"
 
+# ---------------------------
+# Per-device worker (runs in a thread)
+# ---------------------------
+def process_device(device, mode, show_commands, config_commands, dry_run, session_ts=None, reachable=None):
+    """Handle one device end-to-end and return its session report row."""
+    if reachable is None:
+        reachable = is_reachable(device["host"], 22, timeout=3)
+
+    row = {
+        "device_name": device["name"],
+        "host": device["host"],
+        "reachable": reachable,
+        "mode": mode,
+        "status": "fail",
+        "commands_count": len(show_commands) if mode == "show" else len(config_commands),
+        "backup_file": "",
+        "output_file": ""
+    }
+
+    if not reachable:
+        cprint(MSG_UNREACHABLE.format(name=device["name"], host=device["host"]))
+        logging.error(f"{device['name']} unreachable on port 22")
+        row["status"] = "unreachable"
+        return row
+
+    try:
+        cprint(MSG_CONNECTING.format(name=device["name"], host=device["host"]))
+        conn = connect_device(device)
+
+        if mode == "show":
+            cprint(C.C + "📡 Running SHOW commands...")
+            output = run_show_commands(conn, show_commands, pipeline=not device.get("no_pipeline"))
+            out_file = save_output(device["name"], output, mode="show", ts=session_ts)
+
+            row["status"] = "success"
+            row["output_file"] = out_file
+
+        else:
+            # CONFIG MODE
+            if dry_run:
+                cprint(C.Y + "\n🧪 DRY RUN ENABLED — No changes will be pushed.")
+                preview = "\n".join(config_commands)
+                out_file = save_output(device["name"], preview, mode="dryrun", ts=session_ts)
+
+                row["status"] = "dryrun"
+                row["output_file"] = out_file
+
+            else:
+                # Backup before changes
+                backup_file = backup_running_config(conn, device["name"], ts=session_ts)
+                row["backup_file"] = backup_file
+
+                cprint(C.R + "⚙️ Pushing CONFIG commands...")
+                output = run_config_commands(conn, config_commands)
+                out_file = save_output(device["name"], output, mode="config", ts=session_ts)
+
+                row["status"] = "success"
+                row["output_file"] = out_file
+
+        return_to_pool(conn)
+        cprint(MSG_DONE.format(name=device["name"]))
+        logging.info(f"Finished {device['name']} successfully")
+
+    except Exception as e:
+        cprint(MSG_ERROR.format(name=device["name"], err=e))
+        logging.error(f"Error on {device['name']}: {e}")
+        row["status"] = "error"
+
+    return row
+
 # ---------------------------
 # Main
 # ---------------------------
 def main():
+    _ensure_dirs()
     devices = load_devices()
     choice = main_menu()
 
-    session_rows = []
-
     if choice == "1":
         # SHOW MODE
         src = command_source_menu()
@@ -229,76 +767,42 @@ def main():
         show_commands = []
 
     else:
-        print(Fore.RED + "❌ Invalid choice. Run again.")
+        print(C.R + "❌ Invalid choice. Run again." + C.Z)
         return
 
-    for device in devices:
-        reachable = is_reachable(device["host"], 22, timeout=3)
-
-        row = {
-            "device_name": device["name"],
-            "host": device["host"],
-            "reachable": reachable,
-            "mode": mode,
-            "status": "fail",
-            "commands_count": len(show_commands) if mode == "show" else len(config_commands),
-            "backup_file": "",
-            "output_file": ""
-        }
-
-        if not reachable:
-            print(Fore.RED + f"\n🚫 {device['name']} ({device['host']}) unreachable on SSH/22. Skipping.")
-            logging.error(f"{device['name']} unreachable on port 22")
-            row["status"] = "unreachable"
-            session_rows.append(row)
-            continue
-
-        try:
-            print(Fore.MAGENTA + f"\n🔌 Connecting to {device['name']} ({device['host']})...")
-            conn = connect_device(device)
-
-            if mode == "show":
-                print(Fore.CYAN + "📡 Running SHOW commands...")
-                output = run_show_commands(conn, show_commands)
-                out_file = save_output(device["name"], output, mode="show")
+    session_ts = session_timestamp()
 
-                row["status"] = "success"
-                row["output_file"] = out_file
-
-            else:
-                # CONFIG MODE
-                if dry_run:
-                    print(Fore.YELLOW + "\n🧪 DRY RUN ENABLED — No changes will be pushed.")
-                    preview = "\n".join(config_commands)
-                    out_file = save_output(device["name"], preview, mode="dryrun")
-
-                    row["status"] = "dryrun"
-                    row["output_file"] = out_file
-
-                else:
-                    # Backup before changes
-                    backup_file = backup_running_config(conn, device["name"])
-                    row["backup_file"] = backup_file
-
-                    print(Fore.RED + "⚙️ Pushing CONFIG commands...")
-                    output = run_config_commands(conn, config_commands)
-                    out_file = save_output(device["name"], output, mode="config")
+    # Start previously-slow devices first so they don't anchor the tail
+    rtt_cache = _load_rtt_cache()
+    devices.sort(key=lambda d: -rtt_cache.get(d["host"], 0))
 
-                    row["status"] = "success"
-                    row["output_file"] = out_file
-
-            conn.disconnect()
-            print(Fore.GREEN + f"✅ Done with {device['name']}")
-            logging.info(f"Finished {device['name']} successfully")
-
-        except Exception as e:
-            print(Fore.RED + f"❌ Error on {device['name']}: {e}")
-            logging.error(f"Error on {device['name']}: {e}")
-            row["status"] = "error"
-
-        session_rows.append(row)
-
-    save_session_report(session_rows)
+    # Weed out entirely-dead hosts with a fast ICMP sweep, then confirm
+    # SSH/22 on the survivors with one concurrent TCP sweep
+    hosts = [d["host"] for d in devices]
+    responders = ping_sweep(hosts, timeout=1)
+    if responders is None:
+        reachable_map = probe_all(hosts, 22, timeout=3)
+    else:
+        dead = [h for h in hosts if h not in responders]
+        if dead:
+            logging.info(f"ICMP sweep: {len(dead)} host(s) silent, skipping their TCP probe")
+        reachable_map = {h: False for h in hosts}
+        reachable_map.update(probe_all([h for h in hosts if h in responders], 22, timeout=3))
+
+    # SSH is I/O-bound, so fan devices out across a thread pool
+    # max(1, ...) keeps an empty inventory valid — the report still gets written
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, max(1, len(devices)))) as executor:
+        session_rows = list(executor.map(
+            lambda device: process_device(
+                device, mode, show_commands, config_commands, dry_run,
+                session_ts, reachable_map[device["host"]]
+            ),
+            devices
+        ))
+
+    save_session_report(session_rows, ts=session_ts)
+    _save_rtt_cache()
+    flush_writes()
 
 if __name__ == "__main__":
     main()
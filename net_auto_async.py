@@ -0,0 +1,265 @@
+"""
+Python Network Automation Tool (PRO v3) — asyncio edition
+Author: Ivan Bogdanov Ivanov
+
+Async variant of net_auto.py for very large fleets:
+- One event loop instead of one thread per device
+- asyncssh sessions bounded by a semaphore (scales to 1000+ devices)
+- Persistent shell channel per device (Cisco closes the channel
+  after a one-shot conn.run(), so we readuntil() the prompt instead)
+- Async TCP/22 reachability check
+
+Reuses the inventory, command files and report/output layout of
+net_auto.py; run this entry point instead when the device count makes
+threads too heavy.
+"""
+
+import asyncio
+import logging
+import os
+import re
+
+import asyncssh
+
+from net_auto import (
+    _ensure_dirs,
+    _FILE_SEQ,
+    BACKUP_DIR,
+    queue_write,
+    load_devices,
+    load_commands_from_file,
+    get_commands_interactively,
+    save_output,
+    save_session_report,
+    session_timestamp,
+    main_menu,
+    command_source_menu,
+    ask_dry_run,
+    cprint,
+    C,
+    MSG_UNREACHABLE,
+    MSG_CONNECTING,
+    MSG_DONE,
+    MSG_ERROR,
+)
+
+MAX_CONCURRENT = 64
+CONNECT_TIMEOUT = 8
+CMD_TIMEOUT = 10
+
+# Matches a typical IOS exec/enable prompt at the end of the buffer
+PROMPT_RE = re.compile(r"[\r\n][\w.@()/-]+[>#]\s?$")
+
+# ---------------------------
+# Reachability check (TCP 22, async)
+# ---------------------------
+async def is_reachable(host, port=22, timeout=3):
+    """Returns True if TCP port is open, else False."""
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=timeout
+        )
+        writer.close()
+        await writer.wait_closed()
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+# ---------------------------
+# Connect to device
+# ---------------------------
+async def connect_device(device):
+    logging.info(f"Connecting to {device['name']} ({device['host']})")
+
+    conn = await asyncio.wait_for(
+        asyncssh.connect(
+            device["host"],
+            username=device["username"],
+            password=device["password"],
+            known_hosts=None,
+        ),
+        timeout=CONNECT_TIMEOUT,
+    )
+    return conn
+
+async def open_shell(conn):
+    """Open a persistent interactive shell and wait for the first prompt."""
+    process = await conn.create_process(term_type="vt100")
+    await _read_until_prompt(process)
+    process.stdin.write("terminal length 0\n")
+    await _read_until_prompt(process)
+    return process
+
+async def _read_until_prompt(process, timeout=CMD_TIMEOUT):
+    """Read shell output until the device prompt shows up; return the text."""
+    chunks = []
+    tail = ""
+    async with asyncio.timeout(timeout):
+        while True:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            # Search a rolling tail, not the lone chunk — the prompt can
+            # arrive split across two reads
+            tail = (tail + chunk)[-256:]
+            if PROMPT_RE.search(tail):
+                break
+    return "".join(chunks)
+
+# ---------------------------
+# SHOW / CONFIG over the shell channel
+# ---------------------------
+async def run_show_commands(process, show_commands, cmd_timeout=CMD_TIMEOUT):
+    output = []
+    for cmd in show_commands:
+        try:
+            logging.info(f"Running SHOW: {cmd}")
+            process.stdin.write(cmd + "\n")
+            result = await _read_until_prompt(process, timeout=cmd_timeout)
+            output.append(f"\n===== {cmd} =====\n{result}")
+        except (asyncio.TimeoutError, asyncssh.Error) as e:
+            msg = f"[SHOW TIMEOUT/ERROR] {cmd} -> {e}"
+            logging.warning(msg)
+            output.append(f"\n===== {cmd} =====\n{msg}")
+    return "\n".join(output)
+
+async def backup_running_config(process, device_name, ts=None, cmd_timeout=15):
+    """Save running-config to backups/ before pushing changes."""
+    timestamp = ts or session_timestamp()
+    filename = f"{device_name}_running-config_{timestamp}_{next(_FILE_SEQ)}.cfg"
+    filepath = os.path.join(BACKUP_DIR, filename)
+
+    logging.info("Backing up running-config")
+    process.stdin.write("show running-config\n")
+    run_cfg = await _read_until_prompt(process, timeout=cmd_timeout)
+
+    # Trim the echoed command and the trailing prompt line
+    lines = run_cfg.splitlines()
+    if lines and lines[0].strip() == "show running-config":
+        lines = lines[1:]
+    if lines and PROMPT_RE.search("\n" + lines[-1]):
+        lines = lines[:-1]
+    queue_write(filepath, "\n".join(lines).encode("utf-8"))
+
+    logging.info(f"Backup saved to {filepath}")
+    return filepath
+
+async def run_config_commands(process, config_commands, cmd_timeout=CMD_TIMEOUT):
+    logging.info("Entering CONFIG mode")
+    output = []
+    for cmd in ["configure terminal"] + list(config_commands) + ["end"]:
+        process.stdin.write(cmd + "\n")
+        output.append(await _read_until_prompt(process, timeout=cmd_timeout))
+    return "".join(output)
+
+# ---------------------------
+# Per-device worker (one coroutine each)
+# ---------------------------
+async def process_device(device, mode, show_commands, config_commands, dry_run, sem, session_ts=None):
+    async with sem:
+        reachable = await is_reachable(device["host"], 22, timeout=3)
+
+        row = {
+            "device_name": device["name"],
+            "host": device["host"],
+            "reachable": reachable,
+            "mode": mode,
+            "status": "fail",
+            "commands_count": len(show_commands) if mode == "show" else len(config_commands),
+            "backup_file": "",
+            "output_file": ""
+        }
+
+        if not reachable:
+            cprint(MSG_UNREACHABLE.format(name=device["name"], host=device["host"]))
+            logging.error(f"{device['name']} unreachable on port 22")
+            row["status"] = "unreachable"
+            return row
+
+        try:
+            cprint(MSG_CONNECTING.format(name=device["name"], host=device["host"]))
+            conn = await connect_device(device)
+            process = await open_shell(conn)
+
+            if mode == "show":
+                cprint(C.C + "📡 Running SHOW commands...")
+                output = await run_show_commands(process, show_commands)
+                out_file = save_output(device["name"], output, mode="show", ts=session_ts)
+
+                row["status"] = "success"
+                row["output_file"] = out_file
+
+            else:
+                # CONFIG MODE
+                if dry_run:
+                    cprint(C.Y + "\n🧪 DRY RUN ENABLED — No changes will be pushed.")
+                    preview = "\n".join(config_commands)
+                    out_file = save_output(device["name"], preview, mode="dryrun", ts=session_ts)
+
+                    row["status"] = "dryrun"
+                    row["output_file"] = out_file
+
+                else:
+                    # Backup before changes
+                    backup_file = await backup_running_config(process, device["name"], ts=session_ts)
+                    row["backup_file"] = backup_file
+
+                    cprint(C.R + "⚙️ Pushing CONFIG commands...")
+                    output = await run_config_commands(process, config_commands)
+                    out_file = save_output(device["name"], output, mode="config", ts=session_ts)
+
+                    row["status"] = "success"
+                    row["output_file"] = out_file
+
+            conn.close()
+            cprint(MSG_DONE.format(name=device["name"]))
+            logging.info(f"Finished {device['name']} successfully")
+
+        except Exception as e:
+            cprint(MSG_ERROR.format(name=device["name"], err=e))
+            logging.error(f"Error on {device['name']}: {e}")
+            row["status"] = "error"
+
+        return row
+
+# ---------------------------
+# Main
+# ---------------------------
+async def main():
+    _ensure_dirs()
+    devices = load_devices()
+    choice = main_menu()
+
+    if choice == "1":
+        # SHOW MODE
+        src = command_source_menu()
+        show_commands = load_commands_from_file("commands_show.txt") if src == "1" else get_commands_interactively("SHOW")
+        mode = "show"
+        dry_run = False
+        config_commands = []
+
+    elif choice == "2":
+        # CONFIG MODE
+        src = command_source_menu()
+        config_commands = load_commands_from_file("commands_config.txt") if src == "1" else get_commands_interactively("CONFIG")
+        dry_run = ask_dry_run()
+        mode = "config"
+        show_commands = []
+
+    else:
+        print(C.R + "❌ Invalid choice. Run again." + C.Z)
+        return
+
+    session_ts = session_timestamp()
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+    session_rows = await asyncio.gather(*[
+        process_device(device, mode, show_commands, config_commands, dry_run, sem, session_ts)
+        for device in devices
+    ])
+
+    save_session_report(list(session_rows), ts=session_ts)
+
+if __name__ == "__main__":
+    asyncio.run(main())